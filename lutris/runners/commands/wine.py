@@ -117,7 +117,7 @@ def is_disallowed_fs(prefix):
     if not os.path.exists(prefix):
         prefix = os.path.dirname(prefix)
 
-    fs_type = linux.LinuxSystem().get_fs_type_for_path(prefix)
+    fs_type = linux.LINUX_SYSTEM.get_fs_type_for_path(prefix)
     if fs_type is None:
         return True
     logger.info("Creating a prefix in file system type: %s", fs_type)
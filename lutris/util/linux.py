@@ -2,13 +2,12 @@
 
 import json
 import os
-import platform
 import re
 import resource
-import shutil
 import sys
-from collections import Counter, defaultdict
+from collections import Counter
 from collections.abc import Iterator
+from functools import cached_property
 from gettext import gettext as _
 from typing import Any, cast
 
@@ -18,6 +17,7 @@ from lutris.util import cache_single, flatpak, system
 from lutris.util.graphics import drivers, glxinfo, vkquery
 from lutris.util.graphics.glxinfo import GlxInfo
 from lutris.util.log import logger
+from lutris.util.strings import parse_version
 
 try:
     import distro
@@ -32,7 +32,6 @@ SYSTEM_COMPONENTS = {
         "fuser",
         "glxinfo",
         "vulkaninfo",
-        "fuser",
         "7z",
         "gtk-update-icon-cache",
         "lspci",
@@ -41,7 +40,6 @@ SYSTEM_COMPONENTS = {
     "OPTIONAL_COMMANDS": [
         "fluidsynth",
         "nvidia-smi",
-        "fluidsynth",
     ],
     "TERMINALS": [
         "xterm",
@@ -86,6 +84,9 @@ SYSTEM_COMPONENTS = {
     },
 }
 
+MEMINFO_TOTALS_RE = re.compile(r"^(MemTotal|SwapTotal):\s+(\d+)", re.MULTILINE)
+CPUINFO_SUMMARY_RE = re.compile(r"^(vendor_id|model name|cpu cores|siblings)[ \t]*:[ \t]*(.*?)[ \t]*$", re.MULTILINE)
+
 
 @cache_single
 def is_exherbo_with_cross_i686() -> bool:
@@ -95,8 +96,6 @@ def is_exherbo_with_cross_i686() -> bool:
 class LinuxSystem:  # pylint: disable=too-many-public-methods
     """Global cache for system commands"""
 
-    _cache = {}
-
     multiarch_lib_folders = [
         ("/lib", "/lib64"),
         ("/lib32", "/lib64"),
@@ -117,47 +116,75 @@ class LinuxSystem:  # pylint: disable=too-many-public-methods
     required_components = ["OPENGL", "VULKAN", "GNUTLS"]
     optional_components = ["WINE", "GAMEMODE"]
 
-    _glxinfo_unset = object()
-
-    def __init__(self) -> None:
-        for key in ("COMMANDS", "OPTIONAL_COMMANDS", "TERMINALS"):
-            self._cache[key] = {}
-            for command in SYSTEM_COMPONENTS[key]:
-                command_path = shutil.which(command)
-                if not command_path:
-                    command_path = self.get_sbin_path(command)
-                if command_path:
-                    self._cache[key][command] = command_path
-                elif key == "COMMANDS":
-                    logger.warning("Command '%s' not found on your system", command)
-
-        # Detect if system is 64bit capable
-        self.is_64_bit = sys.maxsize > 2**32
-        self.arch = self.get_arch()
-        self.populate_sound_fonts()
-        self.soft_limit, self.hard_limit = self.get_file_limits()
-
-        # Expensive fields are lazy; see properties below.
-        self._shared_libraries: dict[str, list[SharedLibrary]] | None = None
-        self._glxinfo: GlxInfo | None | object = self._glxinfo_unset
+    _mount_points_cache: tuple[str, dict[str, dict[str, Any]]] | None = None
+
+    @cached_property
+    def _commands(self) -> dict[str, str]:
+        return self._find_commands("COMMANDS")
+
+    @cached_property
+    def _optional_commands(self) -> dict[str, str]:
+        return self._find_commands("OPTIONAL_COMMANDS")
+
+    @cached_property
+    def _terminals(self) -> dict[str, str]:
+        return self._find_commands("TERMINALS")
+
+    def _find_commands(self, key: str) -> dict[str, str]:
+        """Return the paths of the commands of a SYSTEM_COMPONENTS category found on the system"""
+        commands = {}
+        for command in SYSTEM_COMPONENTS[key]:
+            command_path = self._which(command)
+            if command_path:
+                commands[command] = command_path
+            elif key == "COMMANDS":
+                logger.warning("Command '%s' not found on your system", command)
+        return commands
+
+    @cached_property
+    def _path_folders(self) -> tuple[str, ...]:
+        return tuple(folder for folder in os.environ.get("PATH", os.defpath).split(os.pathsep) if folder)
+
+    def _which(self, command: str) -> str | None:
+        """Return the path of an executable, looking in $PATH then in the sbin folders"""
+        for folder in self._path_folders:
+            command_path = os.path.join(folder, command)
+            if self._is_executable(command_path):
+                return command_path
+        return self.get_sbin_path(command)
+
+    @staticmethod
+    def _is_executable(path: str) -> bool:
+        return os.access(path, os.X_OK) and not os.path.isdir(path)
+
+    @cached_property
+    def is_64_bit(self) -> bool:
+        """Detect if system is 64bit capable"""
+        return sys.maxsize > 2**32
+
+    @cached_property
+    def arch(self) -> str | None:
+        return self.get_arch()
+
+    @cached_property
+    def _file_limits(self) -> tuple[int, int]:
+        return self.get_file_limits()
 
     @property
-    def shared_libraries(self) -> dict[str, list["SharedLibrary"]]:
-        if self._shared_libraries is None:
-            self._shared_libraries = self.get_shared_libraries()
-            self.populate_libraries()
-        return self._shared_libraries
+    def soft_limit(self) -> int:
+        return self._file_limits[0]
 
     @property
+    def hard_limit(self) -> int:
+        return self._file_limits[1]
+
+    @cached_property
+    def shared_libraries(self) -> dict[str, list["SharedLibrary"]]:
+        return self.get_shared_libraries()
+
+    @cached_property
     def glxinfo(self) -> GlxInfo | None:
-        match self._glxinfo:
-            case GlxInfo() as glx:
-                return glx
-            case None:
-                return None
-            case _:
-                result = self._glxinfo = self.get_glxinfo()
-                return result
+        return self.get_glxinfo()
 
     @staticmethod
     def get_sbin_path(command: str) -> str | None:
@@ -179,17 +206,30 @@ class LinuxSystem:  # pylint: disable=too-many-public-methods
     @staticmethod
     def get_cpus() -> list[dict[str, str]]:
         """Parse the output of /proc/cpuinfo"""
-        cpus = [{}]
-        cpu_index = 0
         with open("/proc/cpuinfo", encoding="utf-8") as cpuinfo:
-            for line in cpuinfo.readlines():
-                if not line.strip():
-                    cpu_index += 1
-                    cpus.append({})
-                    continue
-                key, value = line.split(":", 1)
-                cpus[cpu_index][key.strip()] = value.strip()
-        return [cpu for cpu in cpus if cpu]
+            data = cpuinfo.read()
+        cpus = []
+        for block in data.split("\n\n"):
+            cpu = {}
+            for line in block.splitlines():
+                key, _sep, value = line.partition(":")
+                if key.strip():
+                    cpu[key.strip()] = value.strip()
+            if cpu:
+                cpus.append(cpu)
+        return cpus
+
+    @staticmethod
+    def get_cpu0_summary() -> dict[str, str]:
+        """Return the vendor, model and core counts of the first processor in /proc/cpuinfo"""
+        block = ""
+        with open("/proc/cpuinfo", encoding="utf-8") as cpuinfo:
+            # Only the first processor block is needed, stop reading once it is complete
+            while chunk := cpuinfo.read(4096):
+                block += chunk
+                if "\n\n" in block:
+                    break
+        return dict(CPUINFO_SUMMARY_RE.findall(block.partition("\n\n")[0]))
 
     @staticmethod
     def get_drives() -> list[dict[str, Any]]:
@@ -208,24 +248,43 @@ class LinuxSystem:  # pylint: disable=too-many-public-methods
             devices.extend(device.get("children", []))
             yield device
 
+    def _get_mount_points(self) -> dict[str, dict[str, Any]]:
+        """Return the mounted filesystems keyed by their resolved mount point. The findmnt
+        output is reused for as long as the kernel's mount table is unchanged."""
+        mount_table = self._read_mount_table()
+        if self._mount_points_cache is None or self._mount_points_cache[0] != mount_table:
+            mount_points = {}
+            for device in self._iter_filesystems(self.get_drives()):
+                target = device.get("target")
+                if target:
+                    mount_points.setdefault(os.path.realpath(os.path.expanduser(target)), device)
+            self._mount_points_cache = (mount_table, mount_points)
+        return self._mount_points_cache[1]
+
     @staticmethod
-    def _path_is_on_mount(path: str, mount_point: str) -> bool:
+    def _read_mount_table() -> str:
         try:
-            return os.path.commonpath((path, mount_point)) == mount_point
-        except ValueError:
-            # Paths on different drives can raise ValueError.
-            return False
+            with open("/proc/self/mountinfo", encoding="utf-8") as mountinfo:
+                return mountinfo.read()
+        except OSError:
+            return ""
 
     @staticmethod
     def get_ram_info() -> dict[str, str]:
         """Parse the output of /proc/meminfo and return RAM information in kB"""
         mem = {}
         with open("/proc/meminfo", encoding="utf-8") as meminfo:
-            for line in meminfo.readlines():
+            for line in meminfo.read().splitlines():
                 key, value = line.split(":", 1)
                 mem[key.strip()] = value.strip("kB \n")
         return mem
 
+    @staticmethod
+    def get_ram_totals() -> dict[str, str]:
+        """Return only the MemTotal and SwapTotal entries of /proc/meminfo, in kB"""
+        with open("/proc/meminfo", encoding="utf-8") as meminfo:
+            return dict(MEMINFO_TOTALS_RE.findall(meminfo.read()))
+
     def get_dist_info(self) -> str | tuple[str, str, str]:
         """Return distribution information"""
         if distro is None:
@@ -237,11 +296,12 @@ class LinuxSystem:  # pylint: disable=too-many-public-methods
         return distro.name(), distro.version(), distro.codename()
 
     @staticmethod
+    @cache_single
     def get_arch() -> str | None:
         """Return the system architecture only if compatible
         with the supported architectures from the Lutris API
         """
-        match platform.machine():
+        match os.uname().machine:
             case "x86_64":
                 return "x86_64"
             case "i386" | "i686":
@@ -258,9 +318,8 @@ class LinuxSystem:  # pylint: disable=too-many-public-methods
     def get_kernel_version() -> str:
         """Get kernel info from /proc/version"""
         with open("/proc/version", encoding="utf-8") as kernel_info:
-            info = kernel_info.readlines()[0]
-            version = info.split(" ")[2]
-        return version
+            # The version is the third field of the line: "Linux version <version> ..."
+            return kernel_info.read(256).split(" ", 3)[2]
 
     def gamemode_available(self) -> bool:
         """Return whether gamemode is available"""
@@ -312,32 +371,27 @@ class LinuxSystem:  # pylint: disable=too-many-public-methods
             return [x86, "x86_64"]
         return [x86]
 
-    @property
-    def requirements(self) -> list[str]:
+    @cached_property
+    def requirements(self) -> tuple[str, ...]:
         return self.get_requirements()
 
-    @property
-    def critical_requirements(self) -> list[str]:
+    @cached_property
+    def critical_requirements(self) -> tuple[str, ...]:
         return self.get_requirements(include_optional=False)
 
     def get_fs_type_for_path(self, path: str) -> str | None:
         """Return the filesystem type a given path uses"""
         path = os.path.realpath(os.path.expanduser(path))
-        matching_device = None
-        matching_mount_point = ""
+        mount_points = self._get_mount_points()
 
-        for device in self._iter_filesystems(self.get_drives()):
-            target = device.get("target")
-            if not target:
-                continue
-
-            mount_point = os.path.realpath(os.path.expanduser(target))
-            if self._path_is_on_mount(path, mount_point) and len(mount_point) > len(matching_mount_point):
-                matching_device = device
-                matching_mount_point = mount_point
-
-        if not matching_device:
-            return None
+        # The deepest mount point containing the path is the one it resides on
+        matching_device = mount_points.get(path)
+        while not matching_device:
+            parent = os.path.dirname(path)
+            if parent == path:
+                return None
+            path = parent
+            matching_device = mount_points.get(path)
 
         fs_type = matching_device["fstype"]
         if fs_type == "fuseblk":
@@ -356,26 +410,26 @@ class LinuxSystem:  # pylint: disable=too-many-public-methods
             return None
         return _glxinfo
 
-    def get_requirements(self, include_optional: bool = True) -> list[str]:
+    def get_requirements(self, include_optional: bool = True) -> tuple[str, ...]:
         """Return used system requirements"""
-        _requirements = self.required_components.copy()
+        _requirements = tuple(self.required_components)
         if include_optional:
-            _requirements += self.optional_components
+            _requirements += tuple(self.optional_components)
             if drivers.is_amd():
-                _requirements.append("RADEON")
+                _requirements += ("RADEON",)
         return _requirements
 
     def get(self, command: str) -> str | None:
         """Return a system command path if available"""
-        return self._cache["COMMANDS"].get(command)
+        return self._commands.get(command)
 
     def get_terminals(self) -> list[str]:
         """Return list of installed terminals"""
-        return list(self._cache["TERMINALS"].values())
+        return list(self._terminals.values())
 
     def get_soundfonts(self) -> list[str]:
         """Return path of available soundfonts"""
-        return cast(list[str], self._cache["SOUNDFONTS"])
+        return self._soundfonts
 
     def get_lib_folders(self) -> list[str]:
         """Return shared library folders, sorted by most used to least used"""
@@ -388,75 +442,102 @@ class LinuxSystem:  # pylint: disable=too-many-public-methods
         for lib_folder in self.get_lib_folders():
             exported_lib_folders.add(lib_folder)
             yield lib_folder
+        for lib_paths in self._multiarch_lib_folders_valid:
+            for lib_path in lib_paths:
+                if lib_path not in exported_lib_folders:
+                    yield lib_path
+
+    @cached_property
+    def _multiarch_lib_folders_valid(self) -> list[tuple[str, ...]]:
+        """The existing 32/64 bit library folder pairs; only 32 bit folders on non amd64 setups"""
+        realpaths = {}
+        valid_lib_folders: list[tuple[str, ...]] = []
         for lib_paths in self.multiarch_lib_folders:
             if self.arch != "x86_64":
                 # On non amd64 setups, only the first element is relevant
-                lib_paths = [lib_paths[0]]
+                lib_paths = lib_paths[:1]
             else:
                 # Ignore paths where 64-bit path is link to supposed 32-bit path
-                if os.path.realpath(lib_paths[0]) == os.path.realpath(lib_paths[1]):
+                for path in lib_paths:
+                    if path not in realpaths:
+                        realpaths[path] = os.path.realpath(path)
+                if realpaths[lib_paths[0]] == realpaths[lib_paths[1]]:
                     continue
-            if all(os.path.exists(path) for path in lib_paths):
-                if lib_paths[0] not in exported_lib_folders:
-                    yield lib_paths[0]
-                if len(lib_paths) != 1:
-                    if lib_paths[1] not in exported_lib_folders:
-                        yield lib_paths[1]
-
-    def get_ldconfig_libs(self) -> list[str]:
-        """Return a list of available libraries, as returned by `ldconfig -p`."""
+            if all(os.access(path, os.F_OK) for path in lib_paths):
+                valid_lib_folders.append(lib_paths)
+        return valid_lib_folders
+
+    def get_shared_libraries(self) -> dict[str, list["SharedLibrary"]]:
+        """Loads all available libraries on the system, as returned by `ldconfig -p`,
+        as SharedLibrary instances. The libraries are stored in a dict keyed by library name.
+        """
+        shared_libraries = {}
         ldconfig = self.get("ldconfig")
         if not ldconfig:
             logger.error("Could not detect ldconfig on this system")
-            return []
+            return shared_libraries
 
         ld_cmd = [ldconfig, "-p"]
         if is_exherbo_with_cross_i686():
             ld_cmd = [ldconfig, "-C", "/etc/ld-i686-pc-linux-gnu.cache", "-p"]
 
-        output = system.read_process_output(ld_cmd).split("\n")
-        return [line.strip("\t") for line in output if line.startswith("\t")]
-
-    def get_shared_libraries(self) -> dict[str, list["SharedLibrary"]]:
-        """Loads all available libraries on the system as SharedLibrary instances
-        The libraries are stored in a defaultdict keyed by library name.
-        """
-        shared_libraries = defaultdict(list)
-        for lib_line in self.get_ldconfig_libs():
+        runtime_architectures = self.runtime_architectures
+        for line in system.read_process_output(ld_cmd).splitlines():
+            if not line.startswith("\t"):
+                continue
             try:
-                lib = SharedLibrary.new_from_ldconfig(lib_line)
+                lib = SharedLibrary.new_from_ldconfig(line[1:])
             except ValueError:
-                logger.error("Invalid ldconfig line: %s", lib_line)
+                logger.error("Invalid ldconfig line: %s", line)
                 continue
-            if lib.arch not in self.runtime_architectures:
-                continue
-            shared_libraries[lib.name].append(lib)
+            if lib.arch in runtime_architectures:
+                shared_libraries.setdefault(lib.name, []).append(lib)
         return shared_libraries
 
-    def populate_libraries(self) -> None:
-        """Populates the LIBRARIES cache with what is found on the system"""
-        self._cache["LIBRARIES"] = {}
-        for arch in self.runtime_architectures:
-            self._cache["LIBRARIES"][arch] = defaultdict(list)
-        for req in self.requirements:
-            for lib in SYSTEM_COMPONENTS["LIBRARIES"][req]:  # type: ignore
-                for shared_lib in self.shared_libraries[lib]:
-                    self._cache["LIBRARIES"][shared_lib.arch][req].append(lib)
-
-    def populate_sound_fonts(self) -> None:
-        """Populates the soundfont cache"""
-        self._cache["SOUNDFONTS"] = []
+    @cached_property
+    def _libraries(self) -> dict[str, dict[str, list[str]]]:
+        """The required libraries found on the system, keyed by requirement and architecture"""
+        return {req: self._find_libraries(req) for req in self.requirements}
+
+    def _find_libraries(self, req: str) -> dict[str, list[str]]:
+        """Return the libraries of a requirement found on the system, keyed by architecture"""
+        required_libs = SYSTEM_COMPONENTS["LIBRARIES"][req]  # type: ignore
+        lib_archs = {
+            lib: {shared_lib.arch for shared_lib in self.shared_libraries.get(lib, ())} for lib in required_libs
+        }
+        return {arch: [lib for lib in required_libs if arch in lib_archs[lib]] for arch in self.runtime_architectures}
+
+    @cached_property
+    def _soundfonts(self) -> list[str]:
+        """The soundfonts available on the system"""
+        soundfonts = []
         for folder in self.soundfont_folders:
-            if not os.path.exists(folder):
+            if not os.path.isdir(folder):
                 continue
-            for soundfont in os.listdir(folder):
-                self._cache["SOUNDFONTS"].append(soundfont)
+            with os.scandir(folder) as entries:
+                soundfonts.extend([entry.name for entry in entries if entry.is_file()])
+        return soundfonts
+
+    @cached_property
+    def _missing_matrix(self) -> dict[str, dict[str, list[str]]]:
+        """The missing libraries of each requirement, keyed by requirement and architecture"""
+        return {req: self._find_missing_libs(req) for req in self.requirements}
+
+    def _find_missing_libs(self, req: str) -> dict[str, list[str]]:
+        """Return the missing libraries of a requirement, keyed by architecture"""
+        required_libs = set(SYSTEM_COMPONENTS["LIBRARIES"][req])  # type: ignore
+        libraries = self._libraries[req] if req in self._libraries else self._find_libraries(req)
+        return {arch: sorted(required_libs.difference(found_libs)) for arch, found_libs in libraries.items()}
+
+    def _get_missing_libs_by_arch(self, req: str) -> dict[str, list[str]]:
+        if req in self._missing_matrix:
+            return self._missing_matrix[req]
+        return self._find_missing_libs(req)
 
     def get_missing_requirement_libs(self, req: str) -> list[list[str]]:
         """Return a list of sets of missing libraries for each supported architecture"""
-        _ = self.shared_libraries  # ensure LIBRARIES cache is populated
-        required_libs = set(SYSTEM_COMPONENTS["LIBRARIES"][req])  # type: ignore
-        return [list(required_libs - set(self._cache["LIBRARIES"][arch][req])) for arch in self.runtime_architectures]
+        missing_libs = self._get_missing_libs_by_arch(req)
+        return [list(missing_libs[arch]) for arch in self.runtime_architectures]
 
     def get_missing_libs(self) -> dict[str, list[list[str]]]:
         """Return a dictionary of missing libraries"""
@@ -465,56 +546,57 @@ class LinuxSystem:  # pylint: disable=too-many-public-methods
     def get_missing_lib_arch(self, requirement: str) -> list[str]:
         """Returns a list of architectures that are missing a library for a specific
         requirement."""
-        missing_arch = []
-        for index, arch in enumerate(self.runtime_architectures):
-            if self.get_missing_requirement_libs(requirement)[index]:
-                missing_arch.append(arch)
-        return missing_arch
+        return [arch for arch, missing_libs in self._get_missing_libs_by_arch(requirement).items() if missing_libs]
 
     def is_feature_supported(self, feature: str) -> bool:
         """Return whether the system has the necessary libs to support a feature"""
         if feature == "ACO":
             try:
-                mesa_version = cast(str, LINUX_SYSTEM.glxinfo.GLX_MESA_query_renderer.version)  # type: ignore
-                return mesa_version >= "19.3"
+                mesa_version = cast(str, self.glxinfo.GLX_MESA_query_renderer.version)  # type: ignore
+                return parse_version(mesa_version)[0] >= [19, 3]
             except AttributeError:
                 return False
-        return not self.get_missing_requirement_libs(feature)[0]
+        return not self._get_missing_libs_by_arch(feature)[self.runtime_architectures[0]]
 
     def is_vulkan_supported(self) -> bool:
-        return not LINUX_SYSTEM.get_missing_lib_arch("VULKAN") and vkquery.is_vulkan_supported()
+        return not self.get_missing_lib_arch("VULKAN") and vkquery.is_vulkan_supported()
 
 
 class SharedLibrary:
     """Representation of a Linux shared library"""
 
+    __slots__ = ("arch", "flags", "name", "path")
+
     default_arch = "i386"
 
     def __init__(self, name: str, flags: str, path: str):
-        self.name = name
-        self.flags = [flag.strip() for flag in flags.split(",")]
+        # Names and flags repeat across thousands of ldconfig entries, interning shares them
+        self.name = sys.intern(name)
+        self.flags = tuple(sys.intern(flag.strip()) for flag in flags.split(","))
         self.path = path
+        self.arch = self.get_arch_from_flags(self.flags)
 
     @classmethod
     def new_from_ldconfig(cls, ldconfig_line: str) -> "SharedLibrary":
         """Create a SharedLibrary instance from an output line from ldconfig"""
-        lib_match = re.match(r"^(.*) \((.*)\) => (.*)$", ldconfig_line)
-        if not lib_match:
+        head, separator, path = ldconfig_line.rpartition(" => ")
+        name, flags_separator, flags = head.rpartition(" (")
+        if not separator or not flags_separator or not name or not flags.endswith(")"):
             raise ValueError("Received incorrect value for ldconfig line: %s" % ldconfig_line)
-        return cls(lib_match.group(1), lib_match.group(2), lib_match.group(3))
+        return cls(name, flags[:-1], path)
 
-    @property
-    def arch(self) -> str:
-        """Return the architecture for a shared library"""
+    @classmethod
+    def get_arch_from_flags(cls, flags: tuple[str, ...]) -> str:
+        """Return the architecture for a shared library from its ldconfig flags"""
         detected_arch = ["x86-64", "x32"]
 
         if is_exherbo_with_cross_i686():
             detected_arch.append("libc6")
 
         for arch in detected_arch:
-            if arch in self.flags:
+            if arch in flags:
                 return arch.replace("-", "_")
-        return self.default_arch
+        return cls.default_arch
 
     @property
     def basename(self) -> str:
@@ -530,7 +612,23 @@ class SharedLibrary:
         return "%s (%s)" % (self.name, self.arch)
 
 
-LINUX_SYSTEM = LinuxSystem()
+_LINUX_SYSTEM: LinuxSystem | None = None
+LINUX_SYSTEM: LinuxSystem  # Resolved lazily by __getattr__ below
+
+
+def get_linux_system() -> LinuxSystem:
+    """Return the shared LinuxSystem instance; its probes only run when first accessed"""
+    global _LINUX_SYSTEM
+    if _LINUX_SYSTEM is None:
+        _LINUX_SYSTEM = LinuxSystem()
+    return _LINUX_SYSTEM
+
+
+def __getattr__(name: str) -> Any:
+    # Keeps 'LINUX_SYSTEM' importable without building it at import time
+    if name == "LINUX_SYSTEM":
+        return get_linux_system()
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
 
 def get_default_runner_wine_version() -> str:
@@ -547,26 +645,38 @@ def get_default_runner_wine_version() -> str:
 
 def gather_system_info() -> dict[str, Any]:
     """Get all system information in a single data structure"""
+    linux_system = get_linux_system()
     system_info = {}
     if drivers.is_nvidia():
         system_info["nvidia_driver"] = drivers.get_nvidia_driver_info()
         system_info["nvidia_gpus"] = [drivers.get_nvidia_gpu_info(gpu_id) for gpu_id in drivers.get_nvidia_gpu_ids()]
     system_info["gpus"] = [drivers.get_gpu_info(gpu) for gpu in drivers.get_gpu_cards()]
-    system_info["env"] = dict(os.environ)
-    system_info["missing_libs"] = LINUX_SYSTEM.get_missing_libs()
-    system_info["cpus"] = LINUX_SYSTEM.get_cpus()
-    system_info["drives"] = LINUX_SYSTEM.get_drives()
-    system_info["ram"] = LINUX_SYSTEM.get_ram_info()
-    system_info["dist"] = LINUX_SYSTEM.get_dist_info()
-    system_info["arch"] = LINUX_SYSTEM.get_arch()
-    system_info["kernel"] = LINUX_SYSTEM.get_kernel_version()
-    system_info["glxinfo"] = glxinfo.GlxInfo().as_dict()
+    system_info["env"] = {
+        key: os.environ[key] for key in ("XDG_CURRENT_DESKTOP", "XDG_SESSION_TYPE") if key in os.environ
+    }
+    system_info["missing_libs"] = linux_system.get_missing_libs()
+    system_info["cpus"] = linux_system.get_cpus()
+    system_info["drives"] = linux_system.get_drives()
+    system_info["ram"] = linux_system.get_ram_info()
+    system_info["dist"] = linux_system.get_dist_info()
+    system_info["arch"] = linux_system.get_arch()
+    system_info["kernel"] = linux_system.get_kernel_version()
+    system_info["glxinfo"] = linux_system.glxinfo.as_dict() if linux_system.glxinfo else {}
     return system_info
 
 
 def gather_system_info_dict() -> dict[str, Any]:
     """Get all relevant system information already formatted as a string"""
-    system_info = gather_system_info()
+    linux_system = get_linux_system()
+    system_info: dict[str, Any] = {
+        "env": os.environ,
+        "cpu": linux_system.get_cpu0_summary(),
+        "ram": linux_system.get_ram_totals(),
+        "dist": linux_system.get_dist_info(),
+        "arch": linux_system.get_arch(),
+        "kernel": linux_system.get_kernel_version(),
+        "glxinfo": linux_system.glxinfo.as_dict() if linux_system.glxinfo else {},
+    }
     system_info_readable = {}
     # Add system information
     system_dict = {}
@@ -584,10 +694,10 @@ def gather_system_info_dict() -> dict[str, Any]:
     system_info_readable["Lutris"] = lutris_dict
     # Add CPU information
     cpu_dict = {}
-    cpu_dict["Vendor"] = system_info["cpus"][0].get("vendor_id", "Vendor unavailable")
-    cpu_dict["Model"] = system_info["cpus"][0].get("model name", "Model unavailable")
-    cpu_dict["Physical cores"] = system_info["cpus"][0].get("cpu cores", "Physical cores unavailable")
-    cpu_dict["Logical cores"] = system_info["cpus"][0].get("siblings", "Logical cores unavailable")
+    cpu_dict["Vendor"] = system_info["cpu"].get("vendor_id", "Vendor unavailable")
+    cpu_dict["Model"] = system_info["cpu"].get("model name", "Model unavailable")
+    cpu_dict["Physical cores"] = system_info["cpu"].get("cpu cores", "Physical cores unavailable")
+    cpu_dict["Logical cores"] = system_info["cpu"].get("siblings", "Logical cores unavailable")
     system_info_readable["CPU"] = cpu_dict
     # Add memory information
     ram_dict = {}
@@ -596,7 +706,7 @@ def gather_system_info_dict() -> dict[str, Any]:
     system_info_readable["Memory"] = ram_dict
     # Add graphics information
     graphics_dict = {}
-    if LINUX_SYSTEM.glxinfo:
+    if linux_system.glxinfo:
         graphics_dict["Vendor"] = system_info["glxinfo"].get("opengl_vendor", "Vendor unavailable")
         graphics_dict["OpenGL Renderer"] = system_info["glxinfo"].get("opengl_renderer", "OpenGL Renderer unavailable")
         graphics_dict["OpenGL Version"] = system_info["glxinfo"].get("opengl_version", "OpenGL Version unavailable")
@@ -621,7 +731,7 @@ def gather_system_info_dict() -> dict[str, Any]:
 
 def get_terminal_apps() -> list[str]:
     """Return the list of installed terminal emulators"""
-    return LINUX_SYSTEM.get_terminals()
+    return get_linux_system().get_terminals()
 
 
 def get_default_terminal() -> str | None:
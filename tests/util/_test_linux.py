@@ -1,3 +1,4 @@
+from types import SimpleNamespace
 from unittest import TestCase
 from unittest.mock import patch
 
@@ -60,3 +61,69 @@ class TestLinuxSystem(TestCase):
 
         self.assertEqual(fs_type, "ntfs")
         read_process_output.assert_called_once_with(["blkid", "-o", "value", "-s", "TYPE", "/dev/sdc1"])
+
+    def test_get_shared_libraries_parses_ldconfig_output(self):
+        ldconfig_output = (
+            "3 libs found in cache `/etc/ld.so.cache'\n"
+            "\tlibz.so.1 (libc6,x86-64) => /lib/x86_64-linux-gnu/libz.so.1\n"
+            "\tlibz.so.1 (libc6) => /lib/i386-linux-gnu/libz.so.1\n"
+            "\tlibfoo.so (libc6,x32) => /libx32/libfoo.so\n"
+        )
+        with (
+            patch.object(linux.LinuxSystem, "get", return_value="/sbin/ldconfig"),
+            patch.object(linux.LinuxSystem, "runtime_architectures", ["i386", "x86_64"]),
+            patch.object(linux.system, "read_process_output", return_value=ldconfig_output),
+        ):
+            shared_libraries = self.linux_system.get_shared_libraries()
+
+        self.assertEqual(list(shared_libraries), ["libz.so.1"])
+        self.assertEqual([lib.arch for lib in shared_libraries["libz.so.1"]], ["x86_64", "i386"])
+        self.assertEqual(shared_libraries["libz.so.1"][1].path, "/lib/i386-linux-gnu/libz.so.1")
+
+    def test_get_fs_type_for_path_reuses_drives_while_mount_table_is_unchanged(self):
+        drives = [
+            {"target": "/", "source": "/dev/sda1", "fstype": "ext4"},
+            {"target": "/mnt/games", "source": "/dev/sdb1", "fstype": "xfs"},
+        ]
+        with (
+            patch.object(self.linux_system, "get_drives", return_value=drives) as get_drives,
+            patch.object(self.linux_system, "_read_mount_table", return_value="mounts"),
+        ):
+            self.assertEqual(self.linux_system.get_fs_type_for_path("/mnt/games/library"), "xfs")
+            self.assertEqual(self.linux_system.get_fs_type_for_path("/home/user"), "ext4")
+        get_drives.assert_called_once_with()
+
+    def test_cheap_attributes_do_not_probe_libraries_or_graphics(self):
+        with (
+            patch.object(linux.LinuxSystem, "get_shared_libraries") as get_shared_libraries,
+            patch.object(linux.LinuxSystem, "get_glxinfo") as get_glxinfo,
+            patch.object(linux.LinuxSystem, "_which") as which,
+        ):
+            linux_system = linux.LinuxSystem()
+            _ = linux_system.display_server, linux_system.arch, linux_system.is_64_bit, linux_system.hard_limit
+
+        get_shared_libraries.assert_not_called()
+        get_glxinfo.assert_not_called()
+        which.assert_not_called()
+
+    def test_aco_support_compares_mesa_versions_numerically(self):
+        for mesa_version, expected in (("19.3.0", True), ("19.10.1", True), ("19.2.8", False), ("18.3.6", False)):
+            glxinfo = SimpleNamespace(GLX_MESA_query_renderer=SimpleNamespace(version=mesa_version))
+            with patch.object(linux.LinuxSystem, "glxinfo", glxinfo):
+                self.assertEqual(self.linux_system.is_feature_supported("ACO"), expected, mesa_version)
+
+
+class TestSharedLibrary(TestCase):
+    def test_new_from_ldconfig(self):
+        lib = linux.SharedLibrary.new_from_ldconfig(
+            "libz.so.1 (libc6,x86-64, OS ABI: Linux 3.2.0) => /lib/x86_64-linux-gnu/libz.so.1"
+        )
+        self.assertEqual(lib.name, "libz.so.1")
+        self.assertEqual(lib.flags, ("libc6", "x86-64", "OS ABI: Linux 3.2.0"))
+        self.assertEqual(lib.path, "/lib/x86_64-linux-gnu/libz.so.1")
+        self.assertEqual(lib.arch, "x86_64")
+
+    def test_new_from_ldconfig_rejects_invalid_lines(self):
+        for line in ("libz.so.1", "libz.so.1 (libc6 => /lib/libz.so.1", "libz.so.1 (libc6)"):
+            with self.assertRaises(ValueError):
+                linux.SharedLibrary.new_from_ldconfig(line)